@@ -1,8 +1,15 @@
 import modal
+import asyncio
+import gzip
+import hmac
+import logging
 import os
+import re
+import shutil
 from typing import Dict, Any, Annotated
-from io import BytesIO
+import tempfile
 import zipfile
+from concurrent.futures import ThreadPoolExecutor
 from fastapi import UploadFile, File, Request, Header
 
 # Create a Modal app (previously Stub)
@@ -17,185 +24,403 @@ image = modal.Image.debian_slim(python_version="3.12").pip_install([
 # Create a Modal volume for temporary storage
 volume = modal.Volume.from_name("game-upload-vol", create_if_missing=True)
 
+# Size of the chunks used when compressing entries
+COPY_CHUNK_SIZE = 8 * 1024 * 1024
+
+# CPU cores reserved per container; boto3 request signing and TLS are CPU-bound once uploads run in parallel
+CONTAINER_CPU = 4.0
+
+# Each in-flight upload request uses roughly half a core
+MAX_CONCURRENT_INPUTS = int(CONTAINER_CPU / 0.5)
+
+# Characters not allowed in the R2 key prefix derived from the game name
+UNSAFE_NAME_CHARS = re.compile(r"[^A-Za-z0-9_\-]")
+
+# Content types served for known game asset extensions; anything else is application/octet-stream
+CONTENT_TYPES = {
+    ".html": "text/html",
+    ".css": "text/css",
+    ".js": "application/javascript",
+    ".json": "application/json",
+    ".wasm": "application/wasm",
+    ".png": "image/png",
+    ".jpg": "image/jpeg",
+    ".jpeg": "image/jpeg",
+    ".svg": "image/svg+xml",
+    ".gif": "image/gif",
+    ".ico": "image/x-icon",
+}
+
+# Text-like assets stored gzip-compressed with Content-Encoding: gzip (browsers decode these transparently)
+GZIP_CONTENT_TYPES = {
+    "text/html",
+    "text/css",
+    "application/javascript",
+    "application/json",
+    "application/wasm",
+    "image/svg+xml",
+}
+
+# Smaller entries are stored as-is; gzip's header and trailer would outweigh the savings
+GZIP_MIN_SIZE = 1024
+
+# Number of zip entries each request uploads to R2 in parallel
+UPLOAD_CONCURRENCY = int(os.environ.get("UPLOAD_CONCURRENCY", "16"))
+
+# Threads for the blocking entry uploads, shared by all concurrent inputs so each can reach UPLOAD_CONCURRENCY
+# (asyncio's default executor is capped at cpu_count + 4 workers for the whole container)
+upload_executor = ThreadPoolExecutor(max_workers=MAX_CONCURRENT_INPUTS * UPLOAD_CONCURRENCY)
+
+# The shared R2 client needs a pooled connection for every entry upload any input may have in flight,
+# otherwise urllib3 discards connections and pays for new TLS handshakes
+R2_MAX_POOL_CONNECTIONS = MAX_CONCURRENT_INPUTS * UPLOAD_CONCURRENCY
+
+# Log every uploaded entry and other per-request detail (noisy for large games)
+DEBUG = os.environ.get("UPLOAD_DEBUG", "").lower() in ("1", "true", "yes")
+
+logging.basicConfig(format="%(levelname)s %(message)s")
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.DEBUG if DEBUG else logging.INFO)
+
+# Wraps a stream whose size is already known (e.g. from the zip central directory) so s3transfer can
+# learn it via seek(0, SEEK_END) without decompressing the entry to the end and back.
+class KnownSizeReader:
+    def __init__(self, stream, size: int):
+        self._stream = stream
+        self._size = size
+        self._position = 0
+        self._stream_position = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._position
+
+    def seek(self, offset: int, whence: int = os.SEEK_SET) -> int:
+        if whence == os.SEEK_END:
+            self._position = self._size + offset
+        elif whence == os.SEEK_CUR:
+            self._position += offset
+        else:
+            self._position = offset
+        return self._position
+
+    def read(self, size: int = -1) -> bytes:
+        # Only touch the underlying stream when a read actually lands somewhere else
+        if self._position != self._stream_position:
+            self._stream.seek(self._position)
+        data = self._stream.read(size)
+        self._position += len(data)
+        self._stream_position = self._position
+        return data
+
+# R2 client shared by every invocation served by this container.
+# Building one loads botocore's S3 service model, so warm containers reuse it (clients are thread-safe).
+_s3_client = None
+
+def get_s3_client():
+    global _s3_client
+    if _s3_client is None:
+        import boto3
+        from botocore.config import Config
+
+        _s3_client = boto3.client(
+            "s3",
+            endpoint_url=f"https://{os.environ['R2_ACCOUNT_ID']}.r2.cloudflarestorage.com",
+            aws_access_key_id=os.environ["R2_ACCESS_KEY_ID"],
+            aws_secret_access_key=os.environ["R2_SECRET_ACCESS_KEY"],
+            config=Config(
+                region_name="auto",
+                max_pool_connections=R2_MAX_POOL_CONNECTIONS,
+                # Adaptive retries back off client-side when R2 throttles the parallel uploads (429/503)
+                retries={"max_attempts": 10, "mode": "adaptive"},
+                tcp_keepalive=True,
+                s3={"addressing_style": "virtual"},
+            ),
+        )
+    return _s3_client
+
 @app.function(
     image=image,
+    cpu=CONTAINER_CPU,
+    memory=4096,
     volumes={"/data": volume},
     secrets=[modal.Secret.from_name("r2-credentials")],
     timeout=600
 )
-@modal.concurrent(max_inputs=10)
+@modal.concurrent(max_inputs=MAX_CONCURRENT_INPUTS)
 @modal.fastapi_endpoint(method="POST")
 async def upload(
     request: Request,
     gameZip: Annotated[UploadFile, File()]
 ) -> Dict[str, Any]:
-    import boto3
-    from botocore.config import Config
+    from boto3.s3.transfer import TransferConfig
+    from botocore.exceptions import ClientError
 
-    print("--- New Upload Request (Headers Method) ---")
+    logger.info("--- New Upload Request (Headers Method) ---")
     headers = dict(request.headers)
-    print(f"Request Headers: {headers}")
+    logger.debug("Request Headers: %s", {k: v for k, v in headers.items() if k != "x-upload-password"})
 
     # --- Get Metadata from Headers --- 
     uploadPassword = headers.get('x-upload-password')
     gameName = headers.get('x-game-name')
 
-    print(f"Received Game Name (Header): {gameName}")
-    print(f"Received Upload Password (Header exists): {uploadPassword is not None}")
-    print(f"Received File Name: {gameZip.filename}")
-    print(f"Received File Content-Type: {gameZip.content_type}")
-    
-    print(f"ENV - R2_ACCOUNT_ID: {os.environ.get('R2_ACCOUNT_ID')}")
-    print(f"ENV - R2_ACCESS_KEY_ID: {os.environ.get('R2_ACCESS_KEY_ID', 'Not Set')[:5]}...")
-    print(f"ENV - R2_BUCKET_NAME: {os.environ.get('R2_BUCKET_NAME')}")
-    print(f"ENV - UPLOAD_PASSWORD set: {bool(os.environ.get('UPLOAD_PASSWORD'))}")
-    print(f"ENV - PUBLIC_GAME_URL_BASE: {os.environ.get('PUBLIC_GAME_URL_BASE')}")
+    logger.info("Received Game Name (Header): %s", gameName)
+    logger.debug("Received Upload Password (Header exists): %s", uploadPassword is not None)
+    logger.debug("Received File Name: %s", gameZip.filename)
+    logger.debug("Received File Content-Type: %s", gameZip.content_type)
+
+    logger.debug("ENV - R2_ACCOUNT_ID: %s", os.environ.get('R2_ACCOUNT_ID'))
+    logger.debug("ENV - R2_ACCESS_KEY_ID: %.5s...", os.environ.get('R2_ACCESS_KEY_ID', 'Not Set'))
+    logger.debug("ENV - R2_BUCKET_NAME: %s", os.environ.get('R2_BUCKET_NAME'))
+    logger.debug("ENV - UPLOAD_PASSWORD set: %s", bool(os.environ.get('UPLOAD_PASSWORD')))
+    logger.debug("ENV - PUBLIC_GAME_URL_BASE: %s", os.environ.get('PUBLIC_GAME_URL_BASE'))
 
     if gameName is None:
-        print("Validation Error: X-Game-Name header was not received.")
+        logger.warning("Validation Error: X-Game-Name header was not received.")
         return {"error": "Bad Request: Missing X-Game-Name header."}, 400
         
     if uploadPassword is None:
-        print("Validation Error: X-Upload-Password header was not received.")
+        logger.warning("Validation Error: X-Upload-Password header was not received.")
         return {"error": "Bad Request: Missing X-Upload-Password header."}, 400
 
     expected_password = os.environ.get("UPLOAD_PASSWORD")
     if not expected_password:
-        print("CRITICAL ERROR: UPLOAD_PASSWORD environment variable not set in Modal secret!")
+        logger.critical("UPLOAD_PASSWORD environment variable not set in Modal secret!")
         return {"error": "Server configuration error: Missing upload credential."}, 500
-    if not uploadPassword or uploadPassword != expected_password:
-        print(f"Password validation failed. Provided length: {len(uploadPassword)}, Expected set: True")
+    # Constant-time comparison so response timing does not leak how much of the password matched
+    if not uploadPassword or not hmac.compare_digest(uploadPassword.encode(), expected_password.encode()):
+        logger.warning("Password validation failed. Provided length: %d, Expected set: True", len(uploadPassword))
         return {"error": "Unauthorized: Invalid password."}, 401
-    print("Password validation successful.")
+    logger.debug("Password validation successful.")
 
     if not gameName:
-        print("Game name validation failed: Missing name")
+        logger.warning("Game name validation failed: Missing name")
         return {"error": "Bad Request: Missing gameName field."}, 400
-    safe_game_name = "".join(c if c.isalnum() or c in "-_" else "_" for c in gameName)
+    safe_game_name = UNSAFE_NAME_CHARS.sub("_", gameName)
     if safe_game_name != gameName:
-        print(f"Game name sanitized from '{gameName}' to '{safe_game_name}'")
+        logger.info("Game name sanitized from '%s' to '%s'", gameName, safe_game_name)
     else:
-        print(f"Using game name as provided: {safe_game_name}")
+        logger.debug("Using game name as provided: %s", safe_game_name)
 
-    print(f"Attempting to read zip file: {gameZip.filename} ({gameZip.content_type}) ...")
-    try:
-        zip_content = await gameZip.read()
-        print(f"Successfully read {len(zip_content)} bytes from zip file.")
-    except Exception as e:
-        print(f"ERROR reading zip file content: {str(e)}")
-        return {"error": f"Failed to read uploaded file: {str(e)}"}, 400
-    
-    zip_buffer = BytesIO(zip_content)
-
-    valid_files = []
+    logger.info("Opening zip file: %s (%s, %s bytes) ...", gameZip.filename, gameZip.content_type, gameZip.size)
+    # FastAPI has already spooled the upload to a temporary file, so the archive is used in place.
+    # Opening it only parses the central directory at the end; entries are decompressed during upload.
+    zf = None
     try:
-        print("Validating zip structure...")
-        with zipfile.ZipFile(zip_buffer) as zf:
-            all_names = zf.namelist()
-            print(f"Zip contains {len(all_names)} total entries.")
-            valid_files = [name for name in all_names if not name.startswith("__MACOSX/") and not name.startswith("._") and not name.endswith("/")]
-            print(f"Found {len(valid_files)} potentially valid file entries.")
+        valid_files = []
+        # Entries that pass the filters below; the upload pass iterates these directly
+        to_upload = []
+        try:
+            logger.debug("Validating zip structure...")
+            zf = zipfile.ZipFile(gameZip.file)
+            all_entries = zf.infolist()
+            logger.debug("Zip contains %d total entries.", len(all_entries))
+            has_index = False
+            for info in all_entries:
+                name = info.filename
+                if name.startswith("__MACOSX/") or name.startswith("._") or info.is_dir():
+                    continue
+                to_upload.append(info)
+                valid_files.append(name)
+                if not has_index and name.lower().endswith("index.html"):
+                    has_index = True
+            logger.debug("Found %d potentially valid file entries.", len(valid_files))
             if not valid_files:
-                 print("Zip validation failed: No valid files found after filtering.")
+                 logger.warning("Zip validation failed: No valid files found after filtering.")
                  return {"error": "Invalid zip file: Contains no usable files."}, 400
 
-            has_index = any(
-                name.lower().endswith("index.html")
-                for name in valid_files
-            )
             if not has_index:
-                print("Zip validation failed: index.html not found among valid files:")
-                for fname in valid_files:
-                    print(f"  - {fname}")
+                logger.warning("Zip validation failed: index.html not found among %d valid files.", len(valid_files))
+                logger.debug("Valid files:\n  - %s", "\n  - ".join(valid_files))
                 return {"error": "Invalid zip structure: index.html not found at the root level."}, 400
-            print("Zip structure validated successfully (found index.html)." )
-    except zipfile.BadZipFile as e:
-        print(f"Zip validation failed: BadZipFile - {str(e)}")
-        return {"error": f"Invalid zip file format: {str(e)}"}, 400
-    except Exception as e:
-        print(f"Zip validation failed: Unexpected error - {str(e)}")
-        return {"error": f"Error validating zip file: {str(e)}"}, 500
-    finally:
-        zip_buffer.seek(0)
+            logger.debug("Zip structure validated successfully (found index.html).")
 
-    try:
-        s3 = boto3.client(
-            "s3",
-            endpoint_url=f"https://{os.environ['R2_ACCOUNT_ID']}.r2.cloudflarestorage.com",
-            aws_access_key_id=os.environ["R2_ACCESS_KEY_ID"],
-            aws_secret_access_key=os.environ["R2_SECRET_ACCESS_KEY"],
-            config=Config(region_name="auto"),
-        )
-        print("R2 client initialized successfully.")
-    except KeyError as e:
-        print(f"CRITICAL ERROR: Missing R2 credential environment variable: {str(e)}")
-        return {"error": f"Server configuration error: Missing R2 credential ({str(e)})"}, 500
-    except Exception as e:
-        print(f"ERROR initializing R2 client: {str(e)}")
-        return {"error": f"Failed to initialize storage client: {str(e)}"}, 500
-
-    uploaded_count = 0
-    print("Starting file processing and upload loop...")
-    try:
-        with zipfile.ZipFile(zip_buffer) as zf:
-            for info in zf.infolist():
-                if (
-                    info.filename.startswith("__MACOSX/")
-                    or info.filename.startswith("._")
-                    or info.is_dir()
-                ):
-                    continue
+            # Strip a single top-level folder shared by every file (e.g. "MyGame/index.html")
+            common_prefix = valid_files[0].split('/', 1)[0] + '/'
+            if not all(name.startswith(common_prefix) for name in valid_files):
+                common_prefix = None
+        except zipfile.BadZipFile as e:
+            logger.warning("Zip validation failed: BadZipFile - %s", e)
+            return {"error": f"Invalid zip file format: {str(e)}"}, 400
+        except Exception as e:
+            logger.exception("Zip validation failed: Unexpected error - %s", e)
+            return {"error": f"Error validating zip file: {str(e)}"}, 500
 
-                entry_path = info.filename
-                if '/' in entry_path:
-                     first_part = entry_path.split('/', 1)[0]
-                     if all(f.startswith(first_part + '/') for f in valid_files):
-                         entry_path = entry_path.split('/', 1)[1]
-                         if not entry_path:
-                            continue
-
-                with zf.open(info) as file:
-                    content = file.read()
-
-                content_type = "application/octet-stream"
-                lower_name = entry_path.lower()
-                if lower_name.endswith(".html"): content_type = "text/html"
-                elif lower_name.endswith(".css"): content_type = "text/css"
-                elif lower_name.endswith(".js"): content_type = "application/javascript"
-                elif lower_name.endswith(".json"): content_type = "application/json"
-                elif lower_name.endswith(".wasm"): content_type = "application/wasm"
-                elif lower_name.endswith(".png"): content_type = "image/png"
-                elif lower_name.endswith(".jpg"): content_type = "image/jpeg"
-                elif lower_name.endswith(".jpeg"): content_type = "image/jpeg"
-                elif lower_name.endswith(".svg"): content_type = "image/svg+xml"
-                elif lower_name.endswith(".gif"): content_type = "image/gif"
-                elif lower_name.endswith(".ico"): content_type = "image/x-icon"
+        try:
+            s3 = get_s3_client()
+            bucket = os.environ["R2_BUCKET_NAME"]
+            logger.debug("R2 client initialized successfully.")
+        except KeyError as e:
+            logger.critical("Missing R2 credential environment variable: %s", e)
+            return {"error": f"Server configuration error: Missing R2 credential ({str(e)})"}, 500
+        except Exception as e:
+            logger.exception("Failed to initialize R2 client: %s", e)
+            return {"error": f"Failed to initialize storage client: {str(e)}"}, 500
 
-                key = f"{safe_game_name}/{entry_path}"
-                print(f"Uploading {entry_path} to R2 key {key} with type {content_type}")
-                s3.put_object(
-                    Bucket=os.environ["R2_BUCKET_NAME"],
+        # Entries above the threshold are sent as parallel multipart uploads
+        transfer_config = TransferConfig(
+            multipart_threshold=16 * 1024 * 1024,
+            multipart_chunksize=32 * 1024 * 1024,
+            max_concurrency=8,
+            use_threads=True,
+        )
+
+        def put_body(key: str, body, size: int, extra_args: Dict[str, Any]) -> None:
+            # botocore (aws-chunked checksums) and s3transfer both probe the size with seek(0, SEEK_END);
+            # the wrapper answers that without inflating the zip entry to the end and back
+            body = KnownSizeReader(body, size)
+            if size < transfer_config.multipart_threshold:
+                # A single PUT; avoids a TransferManager and its thread pool per small file
+                s3.put_object(Bucket=bucket, Key=key, Body=body, ContentLength=size, **extra_args)
+            else:
+                s3.upload_fileobj(
+                    Fileobj=body,
+                    Bucket=bucket,
                     Key=key,
-                    Body=content,
-                    ContentType=content_type
+                    ExtraArgs=extra_args,
+                    Config=transfer_config
+                )
+
+        def upload_entry(
+            zf: zipfile.ZipFile,
+            info: zipfile.ZipInfo,
+            key: str,
+            content_type: str,
+            existing_objects: Dict[str, int],
+        ) -> bool:
+            compress = content_type in GZIP_CONTENT_TYPES and info.file_size >= GZIP_MIN_SIZE
+            content_encoding = "gzip" if compress else None
+
+            # The central directory already records each entry's CRC-32 and size, so files unchanged since
+            # the previous upload of this game are detected without reading them
+            metadata = {"crc32": f"{info.CRC:08x}", "size": str(info.file_size)}
+            # An uncompressed object whose listed size differs has certainly changed; otherwise check its metadata
+            if key in existing_objects and (content_encoding or existing_objects[key] == info.file_size):
+                try:
+                    existing = s3.head_object(Bucket=bucket, Key=key)
+                except ClientError as e:
+                    if e.response["Error"]["Code"] not in ("404", "NoSuchKey", "NotFound"):
+                        raise
+                else:
+                    if (
+                        all(existing["Metadata"].get(name) == value for name, value in metadata.items())
+                        and existing.get("ContentType") == content_type
+                        and existing.get("ContentEncoding") == content_encoding
+                    ):
+                        return False
+
+            extra_args = {"ContentType": content_type, "Metadata": metadata}
+            # Stream the entry to R2, through a gzip spool for text-like assets, instead of reading it into memory
+            with zf.open(info) as file:
+                if content_encoding:
+                    extra_args["ContentEncoding"] = content_encoding
+                    with tempfile.SpooledTemporaryFile(max_size=transfer_config.multipart_threshold) as compressed:
+                        with gzip.GzipFile(fileobj=compressed, mode="wb", compresslevel=6, mtime=0) as gz:
+                            shutil.copyfileobj(file, gz, COPY_CHUNK_SIZE)
+                        size = compressed.tell()
+                        compressed.seek(0)
+                        put_body(key, compressed, size, extra_args)
+                else:
+                    put_body(key, file, info.file_size, extra_args)
+            return True
+
+        def list_existing_objects() -> Dict[str, int]:
+            # Maps each key under the game's prefix to its stored size
+            paginator = s3.get_paginator("list_objects_v2")
+            objects = {}
+            for page in paginator.paginate(Bucket=bucket, Prefix=f"{safe_game_name}/"):
+                objects.update((obj["Key"], obj["Size"]) for obj in page.get("Contents", []))
+            return objects
+
+        def delete_keys(keys: list[str]) -> None:
+            # DeleteObjects accepts at most 1000 keys per request
+            for start in range(0, len(keys), 1000):
+                batch = keys[start:start + 1000]
+                response = s3.delete_objects(
+                    Bucket=bucket,
+                    Delete={"Objects": [{"Key": key} for key in batch], "Quiet": True}
+                )
+                if response.get("Errors"):
+                    failed = response["Errors"][0]
+                    raise RuntimeError(f"Failed to delete {failed['Key']}: {failed.get('Message')}")
+
+        upload_slots = asyncio.Semaphore(UPLOAD_CONCURRENCY)
+        # Tasks whose entry has been handed to the executor; those can no longer be cancelled
+        started_uploads = set()
+
+        async def upload_entry_async(
+            info: zipfile.ZipInfo, key: str, content_type: str, existing_objects: Dict[str, int]
+        ) -> bool:
+            # Run the blocking boto3 upload off the event loop so other concurrent inputs keep being served
+            async with upload_slots:
+                started_uploads.add(asyncio.current_task())
+                return await asyncio.get_running_loop().run_in_executor(
+                    upload_executor, upload_entry, zf, info, key, content_type, existing_objects
                 )
-                uploaded_count += 1
 
-        print(f"Successfully uploaded {uploaded_count} files.")
+        logger.debug("Starting file processing and upload loop (concurrency: %d)...", UPLOAD_CONCURRENCY)
+        try:
+            # Objects from a previous upload of this game; anything not in the new zip is removed afterwards
+            existing_objects = await asyncio.to_thread(list_existing_objects)
+            logger.debug("Found %d existing objects under '%s/'.", len(existing_objects), safe_game_name)
 
-    except Exception as e:
-        print(f"Error during R2 upload process: {str(e)}")
-        return {"error": f"Error processing zip file: {str(e)}"}, 500
+            uploads = []
+            uploaded_keys = set()
+            for info in to_upload:
+                entry_path = info.filename.removeprefix(common_prefix) if common_prefix else info.filename
 
-    game_url = f"{os.environ['PUBLIC_GAME_URL_BASE'].rstrip('/')}/{safe_game_name}/index.html"
+                extension = os.path.splitext(entry_path)[1].lower()
+                content_type = CONTENT_TYPES.get(extension, "application/octet-stream")
 
-    print(f"Upload complete. Game URL: {game_url}")
-    return {
-        "message": f"Successfully uploaded game '{safe_game_name}'.",
-        "gameName": safe_game_name,
-        "gameUrl": game_url,
-        "status": "complete"
-    }
+                key = f"{safe_game_name}/{entry_path}"
+                logger.debug("Uploading %s to R2 key %s with type %s", entry_path, key, content_type)
+                uploaded_keys.add(key)
+                uploads.append(asyncio.create_task(upload_entry_async(info, key, content_type, existing_objects)))
+
+            done, pending = await asyncio.wait(uploads, return_when=asyncio.FIRST_EXCEPTION)
+            failed = [task for task in done if task.exception() is not None]
+            if failed:
+                # Drop the entries still waiting for a slot, but let those already running in the
+                # executor finish, since they read from the zip that is closed below
+                for task in pending:
+                    if task not in started_uploads:
+                        task.cancel()
+                if pending:
+                    await asyncio.wait(pending)
+                raise failed[0].exception()
+            uploaded_count = sum(task.result() for task in uploads)
+            logger.info("Successfully uploaded %d files (%d unchanged, skipped).", uploaded_count, len(results) - uploaded_count)
+
+        except Exception as e:
+            logger.exception("Error during R2 upload process: %s", e)
+            return {"error": f"Error processing zip file: {str(e)}"}, 500
+
+        stale_keys = sorted(existing_objects.keys() - uploaded_keys)
+        if stale_keys:
+            try:
+                await asyncio.to_thread(delete_keys, stale_keys)
+                logger.info("Removed %d stale files from the previous upload.", len(stale_keys))
+            except Exception as e:
+                # The new build is fully uploaded, so leftover files are not worth failing the request over
+                logger.exception("Failed to remove stale files: %s", e)
+
+        game_url = f"{os.environ['PUBLIC_GAME_URL_BASE'].rstrip('/')}/{safe_game_name}/index.html"
+
+        logger.info("Upload complete. Game URL: %s", game_url)
+        return {
+            "message": f"Successfully uploaded game '{safe_game_name}'.",
+            "gameName": safe_game_name,
+            "gameUrl": game_url,
+            "status": "complete"
+        }
+    finally:
+        if zf is not None:
+            zf.close()
 
 # For local development
 if __name__ == "__main__":